@@ -33,6 +33,12 @@ bs_read_timeout = 5
 # Max time to wait for a message (if there is none). Important for stopping threads etc.
 bs_receive_timeout = 1
 
+# Receive buffer size (ZMQ RCVBUF, bytes) for the bs_read socket. None leaves the OS default.
+# High-rate streams drop messages on bursts with the usual OS defaults. For the buffer to be
+# fully effective, raise the OS limits as well, e.g. net.core.rmem_max=12582912 and
+# net.core.netdev_max_backlog=5000.
+bs_receive_buffer_size = 12582912
+
 # Default bs_read connection address.
 bs_default_host = None
 # Default bs_read connection port.
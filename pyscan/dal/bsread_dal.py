@@ -1,6 +1,7 @@
-import math
+from operator import itemgetter
 from time import time
 
+import zmq
 from bsread import Source, mflow
 
 from pyscan import config
@@ -25,6 +26,11 @@ class ReadGroupInterface(object):
         self.conditions = convert_to_list(conditions)
         self.filter = filter_function
 
+        # Precomputed getters that fetch all channels from a cached message in a single
+        # C call, in the order the properties were requested.
+        self._properties_getter = self._build_values_getter(self.properties)
+        self._conditions_getter = self._build_values_getter(self.conditions)
+
         self._message_cache = None
         self._message_cache_timestamp = None
         self._message_cache_position_index = None
@@ -52,31 +58,74 @@ class ReadGroupInterface(object):
                                  mode=mode)
         self.stream.connect()
 
+        self._tune_receive_socket()
+
+    def _tune_receive_socket(self):
+        """
+        Enlarge the receive buffer of the underlying ZMQ socket, so message bursts
+        on high-rate streams do not get dropped.
+        """
+        if not config.bs_receive_buffer_size:
+            return
+
+        # The socket and address are not part of the public bsread API - skip the tuning
+        # if they are not reachable.
+        socket = getattr(getattr(self.stream, "stream", None), "socket", None)
+        address = getattr(self.stream, "address", None)
+        if socket is None or address is None:
+            return
+
+        # RCVBUF applies only to connections established after the option is set,
+        # so the already connected endpoint has to be reconnected.
+        try:
+            socket.setsockopt(zmq.RCVBUF, config.bs_receive_buffer_size)
+            socket.disconnect(address)
+            socket.connect(address)
+        except zmq.ZMQError:
+            # The endpoint cannot be re-established - leave the original connection as is.
+            pass
+
     @staticmethod
-    def is_message_after_timestamp(message, timestamp):
+    def is_message_after_timestamp(message, timestamp_sec, timestamp_ns):
         """
         Check if the received message was captured after the provided timestamp.
         :param message: Message to inspect.
-        :param timestamp: Timestamp to compare the message to.
+        :param timestamp_sec: Epoch seconds of the timestamp to compare the message to.
+        :param timestamp_ns: Nanoseconds part of the timestamp to compare the message to.
         :return: True if the message is after the timestamp, False otherwise.
         """
         # Receive might timeout, in this case we have nothing to compare.
         if not message:
             return False
 
-        # This is how BSread encodes the timestamp.
-        current_sec = int(timestamp)
-        current_ns = int(math.modf(timestamp)[0] * 1e9)
+        # Fetch the message data only once.
+        message_data = message.data
 
-        message_sec = message.data.global_timestamp
-        message_ns = message.data.global_timestamp_offset
+        # Compose seconds and nanoseconds into a single integer key - one branchless
+        # compare instead of separate seconds and nanoseconds branches.
+        message_key = message_data.global_timestamp * 1000000000 + message_data.global_timestamp_offset
+        timestamp_key = timestamp_sec * 1000000000 + timestamp_ns
 
-        # If the seconds are the same, the nanoseconds must be equal or larger.
-        if message_sec == current_sec:
-            return message_ns >= current_ns
-        # If the seconds are not the same, the message seconds need to be larger than the current seconds.
-        else:
-            return message_sec > current_sec
+        return message_key >= timestamp_key
+
+    @staticmethod
+    def _build_values_getter(properties):
+        """
+        Build an itemgetter that fetches the channels of all provided properties at once.
+        :param properties: List of property definitions.
+        :return: Callable that maps a message data dictionary to a tuple of channels, or None.
+        """
+        if not properties:
+            return None
+
+        identifiers = [x.identifier for x in properties]
+
+        # itemgetter with a single key returns the bare value - normalize to a tuple.
+        if len(identifiers) == 1:
+            single_getter = itemgetter(identifiers[0])
+            return lambda message_data: (single_getter(message_data),)
+
+        return itemgetter(*identifiers)
 
     @staticmethod
     def _get_missing_property_default(property_definition):
@@ -93,19 +142,30 @@ class ReadGroupInterface(object):
         else:
             return property_definition.default_value
 
-    def _read_pvs_from_cache(self, properties):
+    def _read_pvs_from_cache(self, properties, values_getter=None):
         """
         Read the requested properties from the cache.
         :param properties: List of properties to read.
+        :param values_getter: Optional getter that fetches all the property channels at once.
         :return: List with PV values.
         """
         if not self._message_cache:
             raise ValueError("Message cache is empty, cannot read PVs %s." % properties)
 
+        # Hoist the attribute chain - one dictionary lookup target for the entire read.
+        message_data = self._message_cache.data.data
+
+        if values_getter is not None:
+            try:
+                return [channel.value for channel in values_getter(message_data)]
+            except KeyError:
+                # Some properties are missing in the stream - resolve the defaults below.
+                pass
+
         pv_values = []
         for property_name, property_definition in ((x.identifier, x) for x in properties):
-            if property_name in self._message_cache.data.data:
-                value = self._message_cache.data.data[property_name].value
+            if property_name in message_data:
+                value = message_data[property_name].value
             else:
                 value = self._get_missing_property_default(property_definition)
 
@@ -123,17 +183,28 @@ class ReadGroupInterface(object):
 
         # Perform the actual read.
         read_timestamp = time()
-        while time() - read_timestamp < config.bs_read_timeout:
 
-            message = self.stream.receive(filter=self.filter)
+        # This is how BSread encodes the timestamp - computed once, not per received message.
+        read_timestamp_sec = int(read_timestamp)
+        read_timestamp_ns = int((read_timestamp - read_timestamp_sec) * 1e9)
+
+        # Hoist the loop invariants - on bursty streams this loop drains many buffered messages.
+        receive = self.stream.receive
+        message_filter = self.filter
+        is_message_after_timestamp = self.is_message_after_timestamp
+        read_timeout = config.bs_read_timeout
+
+        while time() - read_timestamp < read_timeout:
+
+            message = receive(filter=message_filter)
 
-            if self.is_message_after_timestamp(message, read_timestamp):
+            if is_message_after_timestamp(message, read_timestamp_sec, read_timestamp_ns):
 
                 self._message_cache = message
                 self._message_cache_position_index = current_position_index
                 self._message_cache_timestamp = read_timestamp
 
-                return self._read_pvs_from_cache(self.properties)
+                return self._read_pvs_from_cache(self.properties, self._properties_getter)
 
         else:
             raise Exception("Read timeout exceeded for BS read stream. Could not find the desired package in time.")
@@ -143,7 +214,7 @@ class ReadGroupInterface(object):
         Returns the conditions associated with the last read command.
         :return: List of condition values.
         """
-        return self._read_pvs_from_cache(self.conditions)
+        return self._read_pvs_from_cache(self.conditions, self._conditions_getter)
 
     def close(self):
         """
@@ -159,11 +230,12 @@ class ReadGroupInterface(object):
 class ImmediateReadGroupInterface(ReadGroupInterface):
 
     @staticmethod
-    def is_message_after_timestamp(message, timestamp):
+    def is_message_after_timestamp(message, timestamp_sec, timestamp_ns):
         """
         Every message is a good message, expect a NULL one.
         :param message: Message to inspect.
-        :param timestamp: Timestamp to compare the message to.
+        :param timestamp_sec: Epoch seconds of the timestamp to compare the message to.
+        :param timestamp_ns: Nanoseconds part of the timestamp to compare the message to.
         :return: True if the message is not None.
         """
         # Receive might timeout, in this case we have nothing to compare.
@@ -180,7 +252,7 @@ class ImmediateReadGroupInterface(ReadGroupInterface):
 
         # Message for this position already cached.
         if current_position_index is not None and current_position_index == self._message_cache_position_index:
-            return self._read_pvs_from_cache(self.properties)
+            return self._read_pvs_from_cache(self.properties, self._properties_getter)
 
         return super(ImmediateReadGroupInterface, self).read(current_position_index=current_position_index,
                                                              retry=retry)
@@ -1,5 +1,7 @@
 import time
-from itertools import count
+from threading import Event
+
+import numpy
 
 from pyscan import config
 from pyscan.utils import convert_to_list, validate_lists_length, connect_to_pv, compare_channel_value
@@ -51,7 +53,6 @@ class WriteGroupInterface(object):
     Manage a group of Write PVs.
     """
     default_timeout = 5
-    default_get_sleep = 0.1
 
     def __init__(self, pv_names, readback_pv_names=None, tolerances=None, timeout=None):
         """
@@ -67,6 +68,10 @@ class WriteGroupInterface(object):
         if readback_pv_names:
             self.readback_pv_name = convert_to_list(readback_pv_names)
             self.readback_pvs = [self.connect(pv_name) for pv_name in self.readback_pv_name]
+
+            # Readbacks are monitored - set_and_match waits on their monitor callbacks.
+            for pv in self.readback_pvs:
+                pv.auto_monitor = True
         else:
             self.readback_pv_name = self.pv_names
             self.readback_pvs = self.pvs
@@ -120,28 +125,40 @@ class WriteGroupInterface(object):
         if not isinstance(timeout, (int, float)):
             raise ValueError("Timeout must be int or float, but %s was provided." % timeout)
 
-        # Write all the PV values.
-        for pv, value in zip(self.pvs, values):
-            pv.put(value)
+        # Events signalled from the callbacks when each PV reaches its target value.
+        events = [Event() for _ in range(len(self.pvs))]
 
-        # Boolean array to represent which PVs have reached their target value.s
-        within_tolerance = [False] * len(self.pvs)
-        initial_timestamp = time.time()
+        # Put completion can confirm the value only when the readback PV is the setpoint PV itself.
+        use_put_complete = self.readback_pvs is self.pvs
 
-        # Read values until all PVs have reached the desired value or time has run out.
-        while (not all(within_tolerance)) and (time.time() - initial_timestamp < timeout):
-            # Get only the PVs that have not yet reached the final position.
-            for index, pv, tolerance in ((index, pv, tolerance) for index, pv, tolerance, values_reached
-                                         in zip(count(), self.readback_pvs, tolerances, within_tolerance)
-                                         if not values_reached):
+        if use_put_complete:
+            # The put-completion callback confirms the value without a readback round-trip.
+            for pv, value, event in zip(self.pvs, values, events):
+                pv.put(value, use_complete=True, callback=lambda event=event, **kwargs: event.set())
+        else:
+            # Monitor callbacks compare each readback value to the target, within tolerance.
+            # Registered before the puts, so a fast move cannot slip through unobserved.
+            callback_indexes = []
+            for pv, expected_value, tolerance, event in zip(self.readback_pvs, values, tolerances, events):
 
-                current_value = pv.get()
-                expected_value = values[index]
+                def on_readback_change(value=None, event=event, expected_value=expected_value,
+                                       tolerance=tolerance, **kwargs):
+                    if compare_channel_value(value, expected_value, tolerance):
+                        event.set()
 
-                if compare_channel_value(current_value, expected_value, tolerance):
-                    within_tolerance[index] = True
+                callback_indexes.append(pv.add_callback(on_readback_change, run_now=True))
 
-            time.sleep(self.default_get_sleep)
+            for pv, value in zip(self.pvs, values):
+                pv.put(value)
+
+        # Wait until all PVs have reached the desired value or time has run out.
+        # The callbacks wake us up - no CPU spent polling.
+        deadline = time.time() + timeout
+        within_tolerance = [event.wait(max(deadline - time.time(), 0)) for event in events]
+
+        if not use_put_complete:
+            for pv, callback_index in zip(self.readback_pvs, callback_indexes):
+                pv.remove_callback(callback_index)
 
         if not all(within_tolerance):
             error_message = ""
@@ -194,9 +211,32 @@ class ReadGroupInterface(object):
 
         return result
 
+    def read_arrays(self, n_measurements=1):
+        """
+        Read all PVs into a single numpy array, bypassing the monitor cache.
+        Collects consecutive measurements into one contiguous buffer, ready for
+        vectorized downstream analysis.
+        :param n_measurements: Number of consecutive measurements to take.
+        :return: Numpy array of shape (n_measurements, n_pvs) for scalar PVs,
+        with an extra trailing dimension for waveform PVs.
+        """
+        # The shape of the result is known only after the first measurement.
+        first_values = [pv.get(use_monitor=False, as_numpy=True) for pv in self.pvs]
+
+        result = numpy.empty((n_measurements,) + numpy.shape(first_values), dtype=float)
+        result[0] = first_values
+
+        for measurement_index in range(1, n_measurements):
+            for pv_index, pv in enumerate(self.pvs):
+                result[measurement_index, pv_index] = pv.get(use_monitor=False, as_numpy=True)
+
+        return result
+
     @staticmethod
     def connect(pv_name):
-        return connect_to_pv(pv_name)
+        # Read PVs are monitored - gets return the latest monitored value
+        # instead of doing a channel access round-trip per PV per read.
+        return connect_to_pv(pv_name, auto_monitor=True)
 
     def close(self):
         """
@@ -1,6 +1,8 @@
 import math
-from copy import copy
 
+import numpy
+
+from pyscan.positioner import kernels
 from pyscan.utils import convert_to_list
 
 
@@ -56,68 +58,81 @@ class AreaPositioner(object):
                               in zip(self.start, self.end, self.n_steps)]
         # Step size case.
         elif self.step_size:
-            self.n_steps = [math.floor((end - start) / step_size) for start, end, step_size
-                            in zip(self.start, self.end, self.step_size)]
+            # Divide first and floor the quotient - floor division rounds differently
+            # for float steps (1.0 // 0.1 == 9.0) and would drop the endpoint.
+            self.n_steps = numpy.floor((numpy.asarray(self.end, dtype=float)
+                                        - numpy.asarray(self.start, dtype=float))
+                                       / numpy.asarray(self.step_size, dtype=float)).astype(int).tolist()
+
+        # Precompute the entire grid as a (n_points, n_axis) array, instead of
+        # building every position with a recursive generator at scan time. Kept
+        # as one contiguous array - large rasters would not fit as nested lists.
+        self._positions = self._build_positions()
+
+    def _build_index_grid(self):
+        """
+        Build the (n_points, n_axis) array of step indexes, in scan order (first axis slowest).
+        :return: Numpy array of step indexes per position.
+        """
+        counts = [n_steps + 1 for n_steps in self.n_steps]
+        n_points = numpy.prod(counts)
+
+        # Fill the grid column by column, like the digits of an odometer: each axis
+        # repeats its values by the size of the inner axes and tiles over the outer ones.
+        # No full-size intermediate arrays, unlike a meshgrid plus stack.
+        indexes = numpy.empty((n_points, self.n_axis), dtype=int)
+        n_repeats = 1
+        for axis in range(self.n_axis - 1, -1, -1):
+            n_tiles = n_points // (counts[axis] * n_repeats)
+            indexes[:, axis] = numpy.tile(numpy.repeat(numpy.arange(counts[axis]), n_repeats), n_tiles)
+            n_repeats *= counts[axis]
+
+        return indexes
+
+    # Optional compiled kernel to fill the grid - used when numba is installed.
+    _grid_kernel = staticmethod(kernels.fill_area_grid) if kernels.numba_available else None
+
+    def _build_positions(self):
+        """
+        Construct all the scan positions as a (n_points, n_axis) array.
+        :return: Numpy array of positions.
+        """
+        start = numpy.asarray(self.start, dtype=float)
+        step_size = numpy.asarray(self.step_size, dtype=float)
+
+        # Large grids benefit from the compiled kernel - native nested loops into
+        # a preallocated buffer, parallelized over the outer dimension.
+        if self._grid_kernel is not None:
+            n_points = numpy.prod([n_steps + 1 for n_steps in self.n_steps])
+            positions = numpy.empty((n_points, self.n_axis), dtype=float)
+            self._grid_kernel(start, step_size, numpy.asarray(self.n_steps, dtype=numpy.int64), positions)
+            return positions
+
+        return start + self._build_index_grid() * step_size
 
     def get_generator(self):
         for _ in range(self.passes):
-            positions = copy(self.start)
-            # Return the initial state.
-            yield copy(positions)
-
-            # Recursive call to print all axis values.
-            def scan_axis(axis_number):
-                # We should not scan axis that do not exist.
-                if not axis_number < self.n_axis:
-                    return
-
-                # Output all position on the next axis while this axis is still at the start position.
-                yield from scan_axis(axis_number + 1)
-
-                # Move axis step by step.
-                for _ in range(self.n_steps[axis_number]):
-                    positions[axis_number] = positions[axis_number] + self.step_size[axis_number]
-                    yield copy(positions)
-                    # Output all positions from the next axis for each value of this axis.
-                    yield from scan_axis(axis_number + 1)
-
-                # Clean up after the loop - return the axis value back to the start value.
-                positions[axis_number] = self.start[axis_number]
-
-            yield from scan_axis(0)
+            for positions in self._positions:
+                yield positions.tolist()
 
 
 class ZigZagAreaPositioner(AreaPositioner):
-    def get_generator(self):
-        for pass_number in range(self.passes):
-            # Directions (positive ascending, negative descending) for each axis.
-            directions = [1] * self.n_axis
-            positions = copy(self.start)
-
-            # Return the initial state.
-            yield copy(positions)
-
-            # Recursive call to print all axis values.
-            def scan_axis(axis_number):
-                # We should not scan axis that do not exist.
-                if not axis_number < self.n_axis:
-                    return
+    _grid_kernel = staticmethod(kernels.fill_zigzag_area_grid) if kernels.numba_available else None
 
-                # Output all position on the next axis while this axis is still at the start position.
-                yield from scan_axis(axis_number + 1)
+    def _build_index_grid(self):
+        """
+        Same as in AreaPositioner, but every axis reverses its direction on alternate sweeps.
+        :return: Numpy array of step indexes per position.
+        """
+        indexes = super(ZigZagAreaPositioner, self)._build_index_grid()
 
-                # Move axis step by step.
-                for _ in range(self.n_steps[axis_number]):
-                    positions[axis_number] = positions[axis_number] + (self.step_size[axis_number]
-                                                                       * directions[axis_number])
-                    yield copy(positions)
-                    # Output all positions from the next axis for each value of this axis.
-                    yield from scan_axis(axis_number + 1)
+        # An axis sweeps backwards whenever the sum of the preceding axes indexes is odd.
+        # Flip axis by axis, so that already flipped indexes determine the direction of the following ones.
+        for axis in range(1, self.n_axis):
+            backwards = (indexes[:, :axis].sum(axis=1) % 2) == 1
+            indexes[backwards, axis] = self.n_steps[axis] - indexes[backwards, axis]
 
-                # Invert the direction for the next iteration on this axis.
-                directions[axis_number] *= -1
-
-            yield from scan_axis(0)
+        return indexes
 
 
 class MultiAreaPositioner(object):
@@ -146,7 +161,9 @@ class MultiAreaPositioner(object):
         # Step size case.
         elif isinstance(steps[0][0], float):
             # TODO: Verify that each axis has the same number of steps and that the step_size is correct (positive etc.)
-            self.n_steps = [[math.floor((end - start) / step) for start, end, step in zip(starts, ends, line_steps)]
+            # Divide first and floor the quotient - floor division rounds differently
+            # for float steps (1.0 // 0.1 == 9.0) and would drop the endpoint.
+            self.n_steps = [[int(math.floor((end - start) / step)) for start, end, step in zip(starts, ends, line_steps)]
                             for starts, ends, line_steps in zip(self.start, self.end, steps)]
             self.step_size = steps
         # Something went wrong
@@ -154,31 +171,15 @@ class MultiAreaPositioner(object):
             # TODO: Raise an exception.
             pass
 
+        # Precompute the values of each axis: (n_steps+1) lists of values per axis.
+        # TODO: Figure out what to do with this steps.
+        self._axis_positions = [(numpy.asarray(self.start[axis], dtype=float)
+                                 + numpy.arange(self.n_steps[axis][0] + 1)[:, numpy.newaxis]
+                                 * numpy.asarray(self.step_size[axis], dtype=float)).tolist()
+                                for axis in range(self.n_axis)]
+
     def get_generator(self):
         for _ in range(self.passes):
-            positions = copy(self.start)
-            # Return the initial state.
-            yield copy(positions)
-
-            # Recursive call to print all axis values.
-            def scan_axis(axis_number):
-                # We should not scan axis that do not exist.
-                if not axis_number < self.n_axis:
-                    return
-
-                # Output all position on the next axis while this axis is still at the start position.
-                yield from scan_axis(axis_number + 1)
-
-                # Move axis step by step.
-                # TODO: Figure out what to do with this steps.
-                for _ in range(self.n_steps[axis_number][0]):
-                    positions[axis_number] = [position + step_size for position, step_size
-                                              in zip(positions[axis_number], self.step_size[axis_number])]
-                    yield copy(positions)
-                    # Output all positions from the next axis for each value of this axis.
-                    yield from scan_axis(axis_number + 1)
-
-                # Clean up after the loop - return the axis value back to the start value.
-                positions[axis_number] = self.start[axis_number]
-
-            yield from scan_axis(0)
+            # Cartesian product of the axis indexes, first axis slowest - same order as the other positioners.
+            for indexes in numpy.ndindex(*(n_steps[0] + 1 for n_steps in self.n_steps)):
+                yield [self._axis_positions[axis][index] for axis, index in enumerate(indexes)]
@@ -1,4 +1,5 @@
-from copy import copy
+from itertools import product
+
 from pyscan.utils import convert_to_list
 
 
@@ -11,11 +12,14 @@ class CompoundPositioner(object):
         self.n_positioners = len(positioners)
 
     def get_generator(self):
-        def walk_positioner(index, output_positions):
-            if index == self.n_positioners:
-                yield copy(output_positions)
-            else:
-                for current_positions in self.positioners[index].get_generator():
-                    yield from walk_positioner(index+1, output_positions + convert_to_list(current_positions))
+        # Generate each positioner trajectory only once and replay it from memory,
+        # instead of re-running the inner generators for every outer position.
+        positioner_outputs = [[convert_to_list(positions) for positions in positioner.get_generator()]
+                              for positioner in self.positioners]
+
+        for output_combination in product(*positioner_outputs):
+            output_positions = []
+            for positions in output_combination:
+                output_positions += positions
 
-        yield from walk_positioner(0, [])
+            yield output_positions
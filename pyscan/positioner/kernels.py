@@ -0,0 +1,60 @@
+import numpy
+
+try:
+    from numba import njit, prange
+    numba_available = True
+except ImportError:
+    numba_available = False
+
+
+if numba_available:
+
+    @njit(parallel=True, cache=True)
+    def fill_area_grid(start, step_size, n_steps, out):
+        """
+        Fill the preallocated (n_points, n_axis) buffer with all area scan positions.
+        :param start: Start position per axis, float64 array.
+        :param step_size: Step size per axis, float64 array.
+        :param n_steps: Number of steps per axis, int64 array.
+        :param out: Preallocated output buffer of shape (n_points, n_axis).
+        """
+        n_axis = start.shape[0]
+        n_points = out.shape[0]
+
+        for point in prange(n_points):
+            # Decode the linear point index into per-axis step indexes (last axis fastest).
+            divisor = 1
+            for axis in range(n_axis - 1, -1, -1):
+                index = (point // divisor) % (n_steps[axis] + 1)
+                divisor *= n_steps[axis] + 1
+
+                out[point, axis] = start[axis] + index * step_size[axis]
+
+    @njit(parallel=True, cache=True)
+    def fill_zigzag_area_grid(start, step_size, n_steps, out):
+        """
+        Same as fill_area_grid, but every axis reverses its direction on alternate sweeps.
+        :param start: Start position per axis, float64 array.
+        :param step_size: Step size per axis, float64 array.
+        :param n_steps: Number of steps per axis, int64 array.
+        :param out: Preallocated output buffer of shape (n_points, n_axis).
+        """
+        n_axis = start.shape[0]
+        n_points = out.shape[0]
+
+        for point in prange(n_points):
+            # Decode the linear point index into per-axis step indexes (last axis fastest).
+            indexes = numpy.empty(n_axis, dtype=numpy.int64)
+            divisor = 1
+            for axis in range(n_axis - 1, -1, -1):
+                indexes[axis] = (point // divisor) % (n_steps[axis] + 1)
+                divisor *= n_steps[axis] + 1
+
+            # An axis sweeps backwards whenever the sum of the preceding axes indexes is odd.
+            index_sum = 0
+            for axis in range(n_axis):
+                if index_sum % 2 == 1:
+                    indexes[axis] = n_steps[axis] - indexes[axis]
+                index_sum += indexes[axis]
+
+                out[point, axis] = start[axis] + indexes[axis] * step_size[axis]
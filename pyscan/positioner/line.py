@@ -1,5 +1,4 @@
-import math
-from copy import copy
+import numpy
 
 from pyscan.utils import convert_to_list
 
@@ -51,8 +50,11 @@ class LinePositioner(object):
             self.step_size = [(end - start) / self.n_steps for start, end in zip(self.start, self.end)]
         # Step size case.
         elif self.step_size:
-            n_steps_per_axis = [math.floor((end - start) / step_size) for start, end, step_size
-                                in zip(self.start, self.end, self.step_size)]
+            # Divide first and floor the quotient - floor division rounds differently
+            # for float steps (1.0 // 0.1 == 9.0) and would drop the endpoint.
+            n_steps_per_axis = numpy.floor((numpy.asarray(self.end, dtype=float)
+                                            - numpy.asarray(self.start, dtype=float))
+                                           / numpy.asarray(self.step_size, dtype=float)).astype(int).tolist()
             # Verify that all axis do the same number of steps.
             if not all(x == n_steps_per_axis[0] for x in n_steps_per_axis):
                 raise ValueError("The step sizes %s must give the same number of steps for each start %s "
@@ -61,31 +63,32 @@ class LinePositioner(object):
             # All the elements in n_steps_per_axis must be the same anyway.
             self.n_steps = n_steps_per_axis[0]
 
+        # Precompute the entire trajectory as a (n_steps+1, n_axis) array - one broadcast
+        # instead of a per-step list comprehension in the generator - and convert it to
+        # Python lists once, so the generators only do a shallow copy per yield.
+        self._positions = (numpy.arange(self.n_steps + 1)[:, numpy.newaxis]
+                           * numpy.asarray(self.step_size, dtype=float)[numpy.newaxis, :]
+                           + numpy.asarray(self.start, dtype=float)[numpy.newaxis, :]).tolist()
+
     def get_generator(self):
         for _ in range(self.passes):
             # The initial position is always the start position.
-            current_positions = copy(self.start)
-            yield current_positions
-
-            for __ in range(self.n_steps):
-                current_positions = [position + step_size for position, step_size
-                                     in zip(current_positions, self.step_size)]
-
-                yield current_positions
+            for current_positions in self._positions:
+                yield list(current_positions)
 
 
 class ZigZagLinePositioner(LinePositioner):
     def get_generator(self):
         # The initial position is always the start position.
-        current_positions = copy(self.start)
-        yield current_positions
+        yield list(self._positions[0])
+
+        # Odd passes walk the same trajectory backwards, skipping the shared endpoint.
+        forward_positions = self._positions[1:]
+        backward_positions = self._positions[-2::-1]
 
         for pass_number in range(self.passes):
             # Positive direction means we increase the position each step, negative we decrease.
-            direction = 1 if pass_number % 2 == 0 else -1
-
-            for __ in range(self.n_steps):
-                current_positions = [position + (step_size * direction) for position, step_size
-                                     in zip(current_positions, self.step_size)]
+            pass_positions = forward_positions if pass_number % 2 == 0 else backward_positions
 
-                yield current_positions
+            for current_positions in pass_positions:
+                yield list(current_positions)
@@ -1,5 +1,3 @@
-from copy import copy
-
 from pyscan.utils import convert_to_list
 
 
@@ -28,13 +26,16 @@ class SerialPositioner(object):
             for axis_positions, offset in zip(self.positions, self.offsets):
                 axis_positions[:] = [original_position + offset for original_position in axis_positions]
 
+        # Precompute the single-pass trajectory - every position is the initial state
+        # with one axis value replaced - and replay it on every pass.
+        self._pass_positions = []
+        for axis_index in range(self.n_axis):
+            for axis_position in convert_to_list(self.positions[axis_index]):
+                current_state = list(self.initial_positions)
+                current_state[axis_index] = axis_position
+                self._pass_positions.append(current_state)
+
     def get_generator(self):
         for _ in range(self.passes):
-            # For each axis.
-            for axis_index in range(self.n_axis):
-                current_state = copy(self.initial_positions)
-
-                n_steps_in_axis = len(self.positions[axis_index])
-                for axis_position_index in range(n_steps_in_axis):
-                    current_state[axis_index] = convert_to_list(self.positions[axis_index])[axis_position_index]
-                    yield copy(current_state)
+            for current_state in self._pass_positions:
+                yield list(current_state)
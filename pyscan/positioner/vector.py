@@ -1,5 +1,3 @@
-from itertools import cycle, chain
-
 from pyscan.utils import convert_to_list
 
 
@@ -42,11 +40,17 @@ class VectorPositioner(object):
 
 
 class ZigZagVectorPositioner(VectorPositioner):
-    def get_generator(self):
-        # This creates a generator for [0, 1, 2, 3... n, n-1, n-2.. 2, 1, 0.....]
-        indexes = cycle(chain(range(0, self.n_positions, 1), range(self.n_positions - 2, 0, -1)))
+    def __init__(self, positions, passes=1, offsets=None):
+        super(ZigZagVectorPositioner, self).__init__(positions, passes=passes, offsets=offsets)
+
+        # This is the cyclic index pattern [0, 1, 2, 3... n, n-1, n-2.. 2, 1].
+        pattern = list(range(0, self.n_positions, 1)) + list(range(self.n_positions - 2, 0, -1))
         # First pass has the full number of items, each subsequent has one less (extreme sequence item).
         n_indexes = self.n_positions + ((self.passes - 1) * (self.n_positions - 1))
 
-        for x in range(n_indexes):
-            yield self.positions[next(indexes)]
+        # Precompute the complete index schedule, instead of cycling an iterator per step.
+        self._indexes = (pattern * (n_indexes // len(pattern) + 1))[:n_indexes]
+
+    def get_generator(self):
+        for index in self._indexes:
+            yield self.positions[index]
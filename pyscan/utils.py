@@ -2,6 +2,8 @@ import inspect
 from collections import OrderedDict
 from time import sleep
 
+import numpy
+
 from epics.pv import PV
 
 from pyscan import config
@@ -77,15 +79,16 @@ def compare_channel_value(current_value, expected_value, tolerance=0.0, operatio
         return compare_value(current_value)
 
 
-def connect_to_pv(pv_name, n_connection_attempts=3):
+def connect_to_pv(pv_name, n_connection_attempts=3, auto_monitor=False):
     """
     Start a connection to a PV.
     :param pv_name: PV name to connect to.
     :param n_connection_attempts: How many times you should try to connect before raising an exception.
+    :param auto_monitor: Subscribe to PV value changes, so reads use the monitored value.
     :return: PV object.
     :raises ValueError if cannot connect to PV.
     """
-    pv = PV(pv_name, auto_monitor=False)
+    pv = PV(pv_name, auto_monitor=auto_monitor)
     for i in range(n_connection_attempts):
         if pv.connect():
             return pv
@@ -116,7 +119,11 @@ def convert_to_list(value):
     If the input parameter is not a list, convert to one.
     :return: The value in a list, or None.
     """
-    # If None or a list, just return the value as it is.
+    # Exact type check first - a plain list is by far the most common input.
+    if type(value) is list:
+        return value
+
+    # If None or a list subclass, just return the value as it is.
     if (value is None) or isinstance(value, list):
         return value
 
@@ -130,7 +137,8 @@ def convert_to_position_list(axis_list):
     :param axis_list: PER KNOB list of positions.
     :return: PER INDEX list of positions.
     """
-    return [list(positions) for positions in zip(*axis_list)]
+    # Transpose in C instead of allocating a Python list per position.
+    return numpy.asarray(axis_list).T.tolist()
 
 
 def flat_list_generator(list_to_flatten):
@@ -175,25 +183,79 @@ class SimpleDataProcessor(object):
     Save the position and the received data at this position.
     """
 
-    def __init__(self, positions=None, data=None):
+    # Initial capacity of the preallocated arrays, when array storage is used.
+    initial_array_capacity = 1024
+
+    def __init__(self, positions=None, data=None, n_axis=None, n_channels=None):
         """
         Initialize the simple data processor.
         :param positions: List to store the visited positions. Default: internal list.
         :param data: List to store the data at each position. Default: internal list.
+        :param n_axis: Number of position axes. Together with n_channels, switches the storage to
+        preallocated numpy arrays - more compact and faster for long purely numeric scans.
+        :param n_channels: Number of data channels read at each position.
         """
-        self.positions = positions if positions is not None else []
-        self.data = data if data is not None else []
+        # Numeric array storage can be used only with known shapes and internal storage.
+        self._use_arrays = ((n_axis is not None) and (n_channels is not None)
+                            and (positions is None) and (data is None))
+
+        if self._use_arrays:
+            self._n_processed = 0
+            self._position_array = numpy.empty((self.initial_array_capacity, n_axis))
+            self._data_array = numpy.empty((self.initial_array_capacity, n_channels))
+        else:
+            self.positions = positions if positions is not None else []
+            self.data = data if data is not None else []
+
+    @staticmethod
+    def _grow_array(array):
+        """
+        Double the capacity of the provided storage array - amortized constant time per append.
+        :param array: Array to grow.
+        :return: Array of twice the capacity, with the data copied over.
+        """
+        grown_array = numpy.empty((array.shape[0] * 2,) + array.shape[1:], dtype=array.dtype)
+        grown_array[:array.shape[0]] = array
+
+        return grown_array
 
     def process(self, position, data):
-        self.positions.append(position)
-        self.data.append(data)
+        if self._use_arrays:
+            if self._n_processed == self._position_array.shape[0]:
+                self._position_array = self._grow_array(self._position_array)
+                self._data_array = self._grow_array(self._data_array)
+
+            self._position_array[self._n_processed] = position
+            self._data_array[self._n_processed] = data
+            self._n_processed += 1
+        else:
+            self.positions.append(position)
+            self.data.append(data)
 
     def get_data(self):
+        if self._use_arrays:
+            return self._data_array[:self._n_processed]
+
         return self.data
 
     def get_positions(self):
+        if self._use_arrays:
+            return self._position_array[:self._n_processed]
+
         return self.positions
 
+    def get_arrays(self):
+        """
+        Get the raw storage arrays, for vectorized downstream analysis.
+        :return: Tuple of (positions, data) numpy arrays, trimmed to the number of processed positions.
+        :raise ValueError if array storage is not used by this processor.
+        """
+        if not self._use_arrays:
+            raise ValueError("Array storage not enabled. Construct the data processor "
+                             "with the n_axis and n_channels parameters.")
+
+        return self._position_array[:self._n_processed], self._data_array[:self._n_processed]
+
 
 class DictionaryDataProcessor(SimpleDataProcessor):
     """
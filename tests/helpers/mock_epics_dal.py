@@ -93,7 +93,7 @@ class MockPV(object):
         else:
             pv_cache[pv_name] = [self]
 
-    def get(self):
+    def get(self, **kwargs):
         if self.pv_name in fixed_values:
             return next(fixed_values[self.pv_name])
         else:
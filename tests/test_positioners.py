@@ -93,6 +93,12 @@ class DiscreetPositionersTests(unittest.TestCase):
         # Generate 4 steps, from 2 to -2, using step size -1.2
         self.verify_result(positioner_type([2], [-2], step_size=[-1.2]), expected_result)
 
+        expected_result = [[x / 10] for x in range(11)]
+
+        # Generate 11 steps, from 0 to 1, using a decimal step size.
+        # The endpoint must not be lost to float rounding (1.0 // 0.1 == 9.0).
+        self.verify_result(positioner_type([0], [1], step_size=[0.1]), expected_result)
+
     def standard_linear_multipass_tests(self, positioner_type):
         """
         Multipass tests that every linear discreet positioner should pass.
@@ -72,4 +72,32 @@ class DataProcessorsTest(unittest.TestCase):
             current_number_of_items += 1
         current_number_of_items = 0
 
-        scan(positioner=positioner, readables=readables, data_processor=data_processor, after_read=after_read)
\ No newline at end of file
+        scan(positioner=positioner, readables=readables, data_processor=data_processor, after_read=after_read)
+
+    def test_array_storage(self):
+        n_images = 10
+        positioner = StaticPositioner(n_images)
+        readables = [epics_pv("PYSCAN:TEST:OBS1"),
+                     epics_pv("PYSCAN:TEST:OBS2"),
+                     epics_pv("PYSCAN:TEST:OBS3")]
+
+        # Shift each OBS by 1, so we can resolve them when comparing results.
+        fixed_values["PYSCAN:TEST:OBS1"] = iter(range(0, n_images))
+        fixed_values["PYSCAN:TEST:OBS2"] = iter(range(1, n_images + 1))
+        fixed_values["PYSCAN:TEST:OBS3"] = iter(range(2, n_images + 2))
+
+        data_processor = SimpleDataProcessor(n_axis=1, n_channels=3)
+
+        result = scan(positioner=positioner, readables=readables, data_processor=data_processor)
+
+        self.assertEqual(result.shape, (n_images, 3), "The data array is not of the expected shape.")
+        self.assertEqual(data_processor.get_positions().shape, (n_images, 1),
+                         "The position array is not of the expected shape.")
+
+        positions, data = data_processor.get_arrays()
+        for index in range(n_images):
+            self.assertEqual(positions[index, 0], index, "Unexpected position.")
+            self.assertEqual(list(data[index]), [index, index + 1, index + 2], "Unexpected data.")
+
+        # Array storage needs the shape hints.
+        self.assertRaises(ValueError, SimpleDataProcessor().get_arrays)
\ No newline at end of file